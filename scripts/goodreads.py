@@ -1,18 +1,38 @@
 import argparse
+import hashlib
+import json
 import logging
 import os
 import re
+import shutil
 import string
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
-from io import StringIO
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
-import feedparser
 import jinja2
 import yaml
 from html_to_markdown import convert
 
+try:
+    from lxml.etree import XMLSyntaxError as ParseError
+    from lxml.etree import iterparse
+except ImportError:
+    from xml.etree.ElementTree import ParseError, iterparse
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(
     filename="goodreads2md.log",
@@ -26,44 +46,85 @@ vals = {
     "false": False,
 }
 
+# Characters stripped from titles: ASCII punctuation (bar hyphens) and ’
+_PUNCT_CHARS = "".join(c for c in string.punctuation if c != "-") + "’"
+_PUNCT_TABLE = str.maketrans("", "", _PUNCT_CHARS)
+# Series number is a single entry (e.g., #3), an omnibus or novella (e.g., #1-3,
+# #0.1), or an omnibus with novella (e.g., #0.1-4). Matched from the last " ("
+_SERIES_RE = re.compile(
+    r" \((?P<series>"
+    r"(?P<series_name>.+?),? #(?P<series_num>\d+(?:\.\d+-\d+|[-\.]\d+)?)"
+    r")\)"
+)
+# Item fields read from the Goodreads RSS feeds; everything else is ignored
+_FEED_FIELDS = frozenset(
+    {
+        "author_name",
+        "book_description",
+        "book_id",
+        "book_large_image_url",
+        "title",
+        "user_rating",
+        "user_read_at",
+        "user_shelves",
+    }
+)
+# Plain "{{ variable }}" Jinja placeholders, with no filters or expressions
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+# Whole title in one pass: "Title: Subtitle (Series Name, #N)"
+_TITLE_RE = re.compile(
+    r"(?P<title>[^:()]+?)"
+    r"(?::\s*(?P<subtitle>[^()]+?))?"
+    r"(?: \((?P<series_name>[^()]+?),? #(?P<series_num>\d+(?:\.\d+-\d+|[-\.]\d+)?)\))?"
+    r"\s*"
+)
+
 
-def read_frontmatter(lines: list[str]) -> dict[str, Any] | None:
+def read_frontmatter_lines(lines: Iterable[str]) -> list[str] | None:
     """
-    Read YAML frontmatter from a Markdown file.
-    YAML must be fenced with `---`.
+    Read the lines of YAML frontmatter from a Markdown file.
+    YAML must be fenced with `---`. Lines are consumed lazily, so an open file
+    is only read up to the closing fence.
     """
-    if not lines or not lines[0].strip() == "---":
+    lines = iter(lines)
+    if not next(lines, "").strip() == "---":
         return None  # no frontmatter
 
     yaml_lines = []
-    for line in lines[1:]:
+    for line in lines:
         if line.strip() == "---":
             break
         yaml_lines.append(line)
 
-    return yaml.safe_load("".join(yaml_lines))
+    return yaml_lines
 
 
-def dict_diff(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
-    """Establish the differences between two dictionaries."""
-    a = {k.replace("-", "_"): v for k, v in a.items()}
-    b = {k.replace("-", "_"): v for k, v in b.items()}
+def get_frontmatter_hash(yaml_lines: list[str]) -> str | None:
+    """Find the metadata hash in frontmatter lines without parsing the YAML."""
+    for line in yaml_lines:
+        if line.startswith("_hash:"):
+            return line.partition(":")[2].strip().strip("'\"")
+    return None
 
-    a = {
-        k: (vals[v] if isinstance(v, str) and (v in vals) else v) for k, v in a.items()
-    }
-    b = {
-        k: (vals[v] if isinstance(v, str) and (v in vals) else v) for k, v in b.items()
+
+def _normalise(d: dict[str, Any]) -> dict[str, Any]:
+    """Normalise dictionary keys and boolean-like string values for comparison."""
+    return {
+        k.replace("-", "_"): (vals[v] if isinstance(v, str) and (v in vals) else v)
+        for k, v in d.items()
     }
 
-    keys_a = set(a)
-    keys_b = set(b)
 
-    only_in_a = keys_a - keys_b
-    only_in_b = keys_b - keys_a
+def dict_diff(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
+    """Establish the differences between two dictionaries."""
+    a = _normalise(a)
+    b = _normalise(b)
+
+    only_in_a = a.keys() - b.keys()
+    only_in_b = b.keys() - a.keys()
 
     different_values = {
-        key: (a[key], b[key]) for key in keys_a & keys_b if a[key] != b[key]
+        key: (a[key], b[key]) for key in a.keys() & b.keys() if a[key] != b[key]
     }
 
     return {
@@ -75,52 +136,58 @@ def dict_diff(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
 
 def remove_punctuation(input_string: str) -> str:
     """Replace punctuation in a string with an empty char"""
-    input_string = input_string.replace("&", "and")
-    regex_pattern = f"[{re.escape(string.punctuation.replace("-", ""))}’]"  # fmt: skip
-    return re.sub(regex_pattern, "", input_string)
-
-
-def get_subtitle(title: str) -> str:
-    """Extract a subtitle from a book's title"""
-    return title.split(":")[1].strip()
+    return input_string.replace("&", "and").translate(_PUNCT_TABLE)
 
 
 def get_series_info(title: str) -> tuple[str, str, str]:
     """Extract book series info from a title string."""
-    patterns = [
-        r".+ \(((.+?),? #(\d+))\)",  # Single entry (e.g., #3)
-        r".+ \(((.+?),? #(\d+[-\.]\d+))\)",  # Omnibus or novella (e.g., #1-3, #0.1)
-        r".+ \(((.+?),? #(\d+\.\d+-\d+))\)",  # Omnibus with novella (e.g., #0.1-4)
-    ]
-
-    for pattern in patterns:
-        match = re.fullmatch(pattern, title)
-        if match:
-            series = f"({match.group(1).strip()})"
-            series_name = remove_punctuation(match.group(2)).strip()
-            series_num = match.group(3).strip()
-            return series, series_name, series_num
+    # Series info is tail-anchored, so only match from the last opening bracket
+    paren = title.rfind(" (")
+    match = _SERIES_RE.fullmatch(title, paren) if paren > 0 else None
+    if not match:
+        return "", "", ""
 
-    # No match found
-    return "", "", ""
+    series = f"({match['series'].strip()})"
+    series_name = remove_punctuation(match["series_name"]).strip()
+    series_num = match["series_num"].strip()
+    return series, series_name, series_num
 
 
 def get_clean_book_info(book_title: str) -> tuple[str, str, str, str]:
     """Extract title, subtitle, and series and ensure it's filesystem safe"""
-    if ("(" in book_title) and ("#" in book_title):
+    match = _TITLE_RE.fullmatch(book_title)
+    if match:
+        title, subtitle, series_name, series_num = match.groups(default="")
+        subtitle = subtitle.strip()
+        # The filename must stay what the step-by-step parsing below gives, so
+        # only take this path when both would drop the same text
+        if (
+            ":" not in subtitle
+            and (not subtitle or subtitle not in title)
+            and not series_name[:1].isspace()
+        ):
+            return (
+                remove_punctuation(title).strip(),
+                subtitle,
+                remove_punctuation(series_name).strip(),
+                series_num,
+            )
+
+    # Series info is always a trailing "(Name, #N)" so only run the regexes then
+    if book_title.endswith(")") and (" #" in book_title):
         series, series_name, series_num = get_series_info(book_title)
         book_title = book_title.replace(series, "")
     else:
-        series = series_name = series_num = ""
+        series_name = series_num = ""
 
-    if ":" in book_title:
-        subtitle = get_subtitle(book_title)
-        book_title = book_title.replace(subtitle, "")
-    else:
-        subtitle = ""
+    # The subtitle is everything after the first colon, but only the segment up
+    # to the next colon is removed from the title, keeping filenames stable
+    _, sep, subtitle = book_title.partition(":")
+    if sep:
+        book_title = book_title.replace(book_title.split(":")[1].strip(), "")
 
     book_title = remove_punctuation(book_title)
-    return book_title.strip(), subtitle, series_name, series_num
+    return book_title.strip(), subtitle.strip(), series_name, series_num
 
 
 def get_clean_shelf(shelf: str) -> str:
@@ -132,44 +199,96 @@ def get_clean_shelf(shelf: str) -> str:
     return shelf
 
 
-def generate_metadata(entry: Any, shelf: str) -> tuple[str, dict[str, Any]]:
-    """Generate book metadata from Goodreads entry"""
+def generate_metadata(
+    entry: Any, shelf: str, updated: str
+) -> tuple[str, dict[str, Any]]:
+    """Generate book metadata from Goodreads entry
+
+    The entry's book_description must already be converted to Markdown.
+    """
     status = get_clean_shelf(shelf)
     title, subtitle, series, series_num = get_clean_book_info(entry.title)
 
-    try:
-        read_at = dt.strptime(entry.user_read_at, "%a, %d %b %Y %H:%M:%S %z")
-        read_at = read_at.strftime("%Y-%m-%d")
-    except ValueError:
-        read_at = ""
+    read_at_parsed = getattr(entry, "user_read_at_parsed", None)
+    read_at = time.strftime("%Y-%m-%d", read_at_parsed) if read_at_parsed else ""
+
+    # Split the user's shelves once, keeping their order for the format list
+    user_shelves = [s.strip() for s in entry.user_shelves.split(",")]
+    user_shelves_set = set(user_shelves)
+    rating = int(entry.user_rating)
 
     metadata_vars = {
         "author": [entry.author_name],
         "book_id": entry.book_id,
-        "book_description": convert(entry.book_description),
+        "book_description": entry.book_description,
         "cover": entry.book_large_image_url,
         "date-last-read": read_at,
         "format": [
-            fmt.strip().replace("format-", "")
-            for fmt in entry.user_shelves.split(",")
-            if fmt.strip().startswith("format")
+            s.removeprefix("format-") for s in user_shelves if s.startswith("format")
         ],
-        "genre": "non-fiction" if "non-fiction" in entry.user_shelves else "fiction",
-        "owned": "true" if "owned" in entry.user_shelves else "false",
-        "rating": int(entry.user_rating) if int(entry.user_rating) > 0 else "",
-        "re_read": "true" if "re-read" in entry.user_shelves else "false",
+        "genre": "non-fiction" if "non-fiction" in user_shelves_set else "fiction",
+        "owned": "true" if "owned" in user_shelves_set else "false",
+        "rating": rating if rating > 0 else "",
+        "re_read": "true" if "re-read" in user_shelves_set else "false",
         "series_name": series,
         "series_number": series_num,
         "status": status,
         "subtitle": subtitle,
-        "updated": dt.now().strftime("%Y-%m-%dT%H:%M"),
+        "updated": updated,
     }
 
+    # Fingerprint everything but the run timestamp so unchanged books can be
+    # spotted without diffing every field
+    hashed = {k: v for k, v in metadata_vars.items() if k != "updated"}
+    metadata_vars["_hash"] = hashlib.blake2b(
+        repr(sorted(hashed.items())).encode(), digest_size=8
+    ).hexdigest()
+
     return title, metadata_vars
 
 
+class _Blank(dict):
+    """Mapping that renders missing template variables as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def make_renderer(env: jinja2.Environment, name: str) -> Callable[..., str]:
+    """Return a render function for a template.
+
+    Templates made up only of plain `{{ variable }}` placeholders are turned
+    into a single str.format_map call, skipping Jinja's per-render context
+    setup. Anything else is rendered by Jinja.
+    """
+    source, _, _ = env.loader.get_source(env, name)
+    parts = _PLACEHOLDER_RE.split(source.removesuffix("\n"))
+    literals = parts[::2]
+
+    if any(tag in text for text in literals for tag in ("{{", "{%", "{#")):
+        return env.get_template(name).render
+
+    fmt = "".join(
+        "{" + part + "}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+        for i, part in enumerate(parts)
+    )
+    return lambda **kwargs: fmt.format_map(_Blank(kwargs))
+
+
+def write_file(filepath: Path, data: bytes) -> None:
+    """Write bytes to a file using a raw file descriptor."""
+    data = memoryview(data)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
 def update_existing_file(
-    filepath: Path, metadata: dict[str, Any], update_template: jinja2.Template
+    filepath: Path, metadata: dict[str, Any], update_render: Callable[..., str]
 ) -> bool:
     """Update an existing Markdown file with new metadata.
 
@@ -177,18 +296,23 @@ def update_existing_file(
     """
     try:
         with open(filepath) as f:
-            current = read_frontmatter(f.readlines())
-        current.pop("book_id", None)
+            yaml_lines = read_frontmatter_lines(f)
 
-        if current is None:
+        if yaml_lines is None:
             logger.warning(f"No frontmatter found in: {filepath}")
             return False
 
+        # Only parse the YAML when the book has actually changed
+        if get_frontmatter_hash(yaml_lines) == metadata["_hash"]:
+            return False
+
+        current = yaml.load("".join(yaml_lines), Loader=SafeLoader)
+        current.pop("book_id", None)
+
         dict_diffs = dict_diff(current, metadata)
         if not dict_diffs["different_values"]:
             return False
 
-        logger.info(f"Updating file: {filepath}")
         if "tags" not in current:
             current["tags"] = ["book"]
         else:
@@ -204,17 +328,18 @@ def update_existing_file(
 
         current.pop("book_description", None)
 
-        stream = StringIO()
-        yaml.dump(current, stream)
-
         updated_metadata = {
-            "yaml": stream.getvalue(),
+            "yaml": yaml.dump(current, Dumper=SafeDumper),
             "book_description": metadata["book_description"],
         }
-        markdown = update_template.render(**updated_metadata)
+        markdown = update_render(**updated_metadata).encode("utf-8")
+
+        # Leave the file (and its mtime) alone if nothing would change
+        if filepath.read_bytes() == markdown:
+            return False
 
-        with open(filepath, "w") as f:
-            f.write(markdown)
+        logger.info(f"Updating file: {filepath}")
+        write_file(filepath, markdown)
 
         return True
 
@@ -224,7 +349,7 @@ def update_existing_file(
 
 
 def create_new_file(
-    filepath: Path, metadata: dict[str, Any], new_template: jinja2.Template
+    filepath: Path, metadata: dict[str, Any], new_render: Callable[..., str]
 ) -> bool:
     """Create a new Markdown file with book metadata.
 
@@ -232,10 +357,8 @@ def create_new_file(
     """
     try:
         logger.info(f"Creating new file: {filepath}")
-        markdown = new_template.render(**metadata)
-
-        with open(filepath, "w") as f:
-            f.write(markdown)
+        markdown = new_render(**metadata)
+        write_file(filepath, markdown.encode("utf-8"))
 
         return True
 
@@ -247,20 +370,25 @@ def create_new_file(
 def process_book_entry(
     entry: Any,
     shelf: str,
+    updated: str,
     dest_dir: Path,
-    new_template: jinja2.Template,
-    update_template: jinja2.Template,
+    existing: set[str],
+    new_render: Callable[..., str],
+    update_render: Callable[..., str],
 ) -> None:
     """Process a single book entry from Goodreads RSS feed."""
     try:
-        title, metadata = generate_metadata(entry, shelf)
-        filepath = dest_dir.joinpath(f"{title}.md")
+        title, metadata = generate_metadata(entry, shelf, updated)
+        filename = f"{title}.md"
+        filepath = dest_dir.joinpath(filename)
 
-        if filepath.exists():
+        # Only stat names missing from the listing, which catches files that
+        # differ just by case on case-insensitive filesystems
+        if filename in existing or filepath.exists():
             metadata.pop("book_id", None)
-            update_existing_file(filepath, metadata, update_template)
-        else:
-            create_new_file(filepath, metadata, new_template)
+            update_existing_file(filepath, metadata, update_render)
+        elif create_new_file(filepath, metadata, new_render):
+            existing.add(filename)
 
     except Exception as e:
         logger.error(
@@ -268,6 +396,115 @@ def process_book_entry(
         )
 
 
+def parse_date(value: str | None) -> dt | None:
+    """Parse an RFC 822 date from a feed, returning None if missing or invalid."""
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def download_feed(url: str, cache_path: Path) -> None:
+    """Download a feed to cache_path unless the cached copy is still current.
+
+    The ETag and Last-Modified headers of the previous response are stored next
+    to the cached feed and sent back as a conditional GET.
+    """
+    headers_path = cache_path.with_suffix(".json")
+    headers = {"User-Agent": "goodreads2md"}
+
+    if cache_path.exists() and headers_path.exists():
+        cached = json.loads(headers_path.read_text())
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
+
+    request = urllib.request.Request(url, headers=headers)
+    tmp_path = cache_path.with_suffix(".tmp")
+
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response, f)
+            etag = response.headers.get("ETag")
+            modified = response.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            logger.info(f"Feed unchanged, using cached copy: {cache_path}")
+            return
+        raise
+
+    tmp_path.replace(cache_path)
+    headers_path.write_text(json.dumps({"etag": etag, "modified": modified}))
+
+
+def read_feed(url: str, cache_path: Path) -> list[SimpleNamespace]:
+    """Fetch a Goodreads RSS feed and return the text fields of each item.
+
+    Unchanged feeds are read back from cache_path. Items are parsed
+    incrementally and cleared once read.
+    """
+    download_feed(url, cache_path)
+    entries = []
+
+    for _, item in iterparse(str(cache_path), events=("end",)):
+        if item.tag != "item":
+            continue
+
+        fields = {
+            child.tag: (child.text or "").strip()
+            for child in item
+            if child.tag in _FEED_FIELDS
+        }
+
+        # Parse the read date once here, keeping the feed's own timezone
+        read_at = parse_date(fields.get("user_read_at"))
+        fields["user_read_at_parsed"] = read_at.timetuple() if read_at else None
+
+        entries.append(SimpleNamespace(**fields))
+        item.clear()
+
+    return entries
+
+
+def convert_descriptions(
+    entries: list[SimpleNamespace],
+    previous: dict[str, str],
+    converted: dict[str, str],
+) -> list[SimpleNamespace]:
+    """Convert each entry's HTML book description to Markdown in place.
+
+    Conversions are keyed by a hash of the HTML. Any found in this run's
+    converted dict or the previous run's are reused, so only new descriptions
+    are converted. Every conversion used ends up in converted.
+
+    Returns the entries that were converted; any that fail are logged and left
+    out so the rest of the shelf is still processed.
+    """
+    converted_entries = []
+
+    for entry in entries:
+        try:
+            key = hashlib.blake2b(
+                entry.book_description.encode(), digest_size=16
+            ).hexdigest()
+            if key in previous and key not in converted:
+                converted[key] = previous[key]
+            elif key not in converted:
+                converted[key] = convert(entry.book_description)
+            entry.book_description = converted[key]
+        except Exception as e:
+            logger.error(
+                f"Error processing book entry '{getattr(entry, 'title', 'unknown')}': {e}"
+            )
+            continue
+
+        converted_entries.append(entry)
+
+    return converted_entries
+
+
 def main() -> None:
     """Main entry point for the Goodreads to Markdown script."""
     parser = argparse.ArgumentParser()
@@ -278,21 +515,41 @@ def main() -> None:
     # Set root path
     ROOT = Path(__file__).parent.parent
 
-    # Read in the template files with Jinja
+    # Set up the cache for compiled templates and downloaded feeds
+    CACHE_DIR = Path("~/.cache/goodreads2md").expanduser()
+    FEED_CACHE_DIR = CACHE_DIR.joinpath("feeds")
     try:
-        with open(ROOT.joinpath("templates", "template-book-new.md")) as f:
-            new_template = jinja2.Template(f.read())
-
-        with open(ROOT.joinpath("templates", "template-book-update.md")) as f:
-            update_template = jinja2.Template(f.read())
+        FEED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     except OSError as e:
+        logger.error(f"Error creating cache directory: {e}")
+        return
+
+    # Read in the book descriptions converted to Markdown on the previous run
+    DESCRIPTION_CACHE = CACHE_DIR.joinpath("descriptions.json")
+    try:
+        previous_descriptions = json.loads(DESCRIPTION_CACHE.read_text())
+    except (OSError, ValueError):
+        previous_descriptions = {}
+    descriptions = {}
+
+    # Load the templates with Jinja, caching compiled bytecode between runs
+    try:
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(ROOT.joinpath("templates")),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(CACHE_DIR)),
+            auto_reload=False,
+        )
+        new_render = make_renderer(env, "template-book-new.md")
+        update_render = make_renderer(env, "template-book-update.md")
+    except (OSError, jinja2.TemplateError) as e:
         logger.error(f"Error reading template files: {e}")
         return
 
     # Read in Goodreads shelves to query
     try:
-        with open(ROOT.joinpath("resources", "goodreads-shelves.txt")) as f:
-            shelves = [line.strip("\n") for line in f.readlines()]
+        shelves = (
+            ROOT.joinpath("resources", "goodreads-shelves.txt").read_text().splitlines()
+        )
     except OSError as e:
         logger.error(f"Error reading shelves file: {e}")
         return
@@ -320,27 +577,80 @@ def main() -> None:
     # Construct Goodreads RSS base URL
     gr_rss_base_url = f"https://www.goodreads.com/review/list_rss/{GOODREADS_USER_ID}?key={GOODREADS_RSS_KEY}&shelf="
 
-    # Retrieve all the books in the Goodreads RSS feeds for each shelf
-    for shelf in shelves:
-        logger.info(f"Reading shelf: {shelf}")
+    # List the files already in the destination directory
+    try:
+        with os.scandir(args.dirpath) as it:
+            existing = {e.name for e in it if e.is_file()}
+    except OSError as e:
+        logger.error(f"Error reading destination directory: {e}")
+        return
 
-        try:
-            feed = feedparser.parse(gr_rss_base_url + shelf)
+    # Timestamp shared by every file touched during this run
+    updated = dt.now().strftime("%Y-%m-%dT%H:%M")
+
+    # Retrieve all the books in the Goodreads RSS feeds for each shelf. Feeds are
+    # fetched concurrently but processed in shelf order so that books appearing on
+    # more than one shelf always end up with the same status.
+    with ThreadPoolExecutor(max_workers=min(8, len(shelves) or 1)) as executor:
+        futures = {
+            shelf: executor.submit(
+                read_feed,
+                gr_rss_base_url + shelf,
+                FEED_CACHE_DIR.joinpath(f"{shelf}.xml"),
+            )
+            for shelf in shelves
+        }
 
-            if feed.bozo:
-                logger.warning(
-                    f"Error parsing feed for shelf '{shelf}': {feed.bozo_exception}"
-                )
-                continue
+        for shelf, future in futures.items():
+            logger.info(f"Reading shelf: {shelf}")
+
+            try:
+                try:
+                    entries = future.result()
+                except ParseError as e:
+                    logger.warning(f"Error parsing feed for shelf '{shelf}': {e}")
+                    continue
 
-            for entry in feed.entries:
-                process_book_entry(
-                    entry, shelf, args.dirpath, new_template, update_template
+                entries = convert_descriptions(
+                    entries, previous_descriptions, descriptions
                 )
 
-        except Exception as e:
-            logger.error(f"Error processing shelf '{shelf}': {e}")
-            continue
+                # Different entries can clean to the same filename (subtitles are
+                # dropped), so each file's entries are handled serially in feed
+                # order and only different files are written in parallel
+                groups: dict[str, list[Any]] = {}
+                for entry in entries:
+                    title, _, _, _ = get_clean_book_info(getattr(entry, "title", ""))
+                    groups.setdefault(title.casefold(), []).append(entry)
+
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as entry_executor:
+                    list(
+                        entry_executor.map(
+                            lambda group: [
+                                process_book_entry(
+                                    entry,
+                                    shelf,
+                                    updated,
+                                    args.dirpath,
+                                    existing,
+                                    new_render,
+                                    update_render,
+                                )
+                                for entry in group
+                            ],
+                            groups.values(),
+                        )
+                    )
+
+            except Exception as e:
+                logger.error(f"Error processing shelf '{shelf}': {e}")
+                continue
+
+    # Keep only the descriptions seen this run for next time
+    try:
+        DESCRIPTION_CACHE.write_text(json.dumps(descriptions))
+    except OSError as e:
+        logger.warning(f"Error writing description cache: {e}")
 
 
 if __name__ == "__main__":